@@ -13,6 +13,7 @@ import (
 	"github.com/gofiber/fiber/v2/middleware/recover"
 
 	"github.com/pranahonk/sabda-scraper-go/internal/handlers"
+	"github.com/pranahonk/sabda-scraper-go/internal/models"
 	"github.com/pranahonk/sabda-scraper-go/internal/services"
 	"github.com/pranahonk/sabda-scraper-go/pkg/config"
 )
@@ -38,6 +39,9 @@ func main() {
 		},
 	)
 	scraperService := services.NewScraperService(cfg.Server.Debug, cacheService)
+	if cfg.Cache.Prewarm {
+		go scraperService.Prewarm(time.Now())
+	}
 
 	// Initialize handlers
 	authHandler := handlers.NewAuthHandler(authService, rateLimitService)
@@ -106,6 +110,7 @@ func setupRoutes(app *fiber.App, authHandler *handlers.AuthHandler, sabdaHandler
 
 	// Protected routes
 	api.Get("/sabda", authHandler.AuthMiddleware(), sabdaHandler.GetContent)
+	api.Post("/sabda/batch", authHandler.AuthMiddleware(), sabdaHandler.GetBatchContent)
 
 	// Home route (public)
 	app.Get("/", sabdaHandler.Home)
@@ -118,12 +123,12 @@ func customErrorHandler(c *fiber.Ctx, err error) error {
 		code = e.Code
 	}
 
-	return c.Status(code).JSON(fiber.Map{
-		"status":  "error",
-		"message": err.Error(),
-		"metadata": map[string]interface{}{
-			"error_type": "ServerError",
-			"timestamp":  time.Now(),
+	return c.Status(code).JSON(models.APIResponse{
+		Status:  "error",
+		Message: err.Error(),
+		Metadata: models.ErrorMetadata{
+			ErrorType: "ServerError",
+			Timestamp: time.Now(),
 		},
 	})
 }
@@ -34,8 +34,8 @@ func (h *AuthHandler) GetToken(c *fiber.Ctx) error {
 		return c.Status(429).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "Too many token requests. Please try again later.",
-			Metadata: map[string]interface{}{
-				"error_type": "RateLimitError",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "RateLimitError",
 			},
 		})
 	}
@@ -45,8 +45,8 @@ func (h *AuthHandler) GetToken(c *fiber.Ctx) error {
 		return c.Status(400).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "Invalid request body",
-			Metadata: map[string]interface{}{
-				"error_type": "ValidationError",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "ValidationError",
 			},
 		})
 	}
@@ -55,21 +55,22 @@ func (h *AuthHandler) GetToken(c *fiber.Ctx) error {
 		return c.Status(400).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "API key is required in request body",
-			Metadata: map[string]interface{}{
-				"error_type": "AuthenticationError",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "AuthenticationError",
 			},
 		})
 	}
 
 	// Generate token
+	now := time.Now()
 	token, expiresAt, err := h.authService.GenerateToken(req.APIKey)
 	if err != nil {
 		log.Printf("Invalid API key attempt from IP: %s", clientIP)
 		return c.Status(401).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "Invalid API key",
-			Metadata: map[string]interface{}{
-				"error_type": "AuthenticationError",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "AuthenticationError",
 			},
 		})
 	}
@@ -80,10 +81,10 @@ func (h *AuthHandler) GetToken(c *fiber.Ctx) error {
 		Data: models.AuthResponse{
 			Token:     token,
 			TokenType: "Bearer",
-			ExpiresIn: int64(time.Until(expiresAt).Seconds()),
+			ExpiresIn: int64(expiresAt.Sub(now).Seconds()),
 		},
 		Metadata: models.AuthMetadata{
-			Timestamp: time.Now(),
+			Timestamp: now,
 			ExpiresAt: expiresAt,
 		},
 	})
@@ -100,8 +101,8 @@ func (h *AuthHandler) AuthMiddleware() fiber.Handler {
 			return c.Status(429).JSON(models.APIResponse{
 				Status:  "error",
 				Message: "Rate limit exceeded. Please try again later.",
-				Metadata: map[string]interface{}{
-					"error_type": "RateLimitError",
+				Metadata: models.ErrorMetadata{
+					ErrorType: "RateLimitError",
 				},
 			})
 		}
@@ -112,8 +113,8 @@ func (h *AuthHandler) AuthMiddleware() fiber.Handler {
 			return c.Status(401).JSON(models.APIResponse{
 				Status:  "error",
 				Message: "Authorization header is required",
-				Metadata: map[string]interface{}{
-					"error_type": "AuthenticationError",
+				Metadata: models.ErrorMetadata{
+					ErrorType: "AuthenticationError",
 				},
 			})
 		}
@@ -131,8 +132,8 @@ func (h *AuthHandler) AuthMiddleware() fiber.Handler {
 			return c.Status(401).JSON(models.APIResponse{
 				Status:  "error",
 				Message: "Invalid authorization header format. Use 'Bearer <token>'",
-				Metadata: map[string]interface{}{
-					"error_type": "AuthenticationError",
+				Metadata: models.ErrorMetadata{
+					ErrorType: "AuthenticationError",
 				},
 			})
 		}
@@ -144,8 +145,8 @@ func (h *AuthHandler) AuthMiddleware() fiber.Handler {
 			return c.Status(401).JSON(models.APIResponse{
 				Status:  "error",
 				Message: "Invalid or expired token",
-				Metadata: map[string]interface{}{
-					"error_type": "AuthenticationError",
+				Metadata: models.ErrorMetadata{
+					ErrorType: "AuthenticationError",
 				},
 			})
 		}
@@ -1,9 +1,10 @@
 package handlers
 
 import (
+	"encoding/json"
 	"log"
-	"regexp"
 	"strconv"
+	"sync"
 	"time"
 
 	"github.com/gofiber/fiber/v2"
@@ -11,6 +12,14 @@ import (
 	"github.com/pranahonk/sabda-scraper-go/internal/services"
 )
 
+// Batch requests cover at most a month of dates. Only a few uncached dates
+// are scraped per request, since each one costs a throttled upstream fetch
+// and the whole batch is charged a single rate-limit hit.
+const (
+	batchMaxDates  = 31
+	batchMaxMisses = 4
+)
+
 // SABDAHandler handles SABDA scraping endpoints
 type SABDAHandler struct {
 	scraperService *services.ScraperService
@@ -44,8 +53,8 @@ func (h *SABDAHandler) GetContent(c *fiber.Ctx) error {
 		return c.Status(400).JSON(models.APIResponse{
 			Status:  "error",
 			Message: joinStrings(validationErrors, "; "),
-			Metadata: map[string]interface{}{
-				"error_type": "ValidationError",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "ValidationError",
 			},
 		})
 	}
@@ -56,59 +65,40 @@ func (h *SABDAHandler) GetContent(c *fiber.Ctx) error {
 		return c.Status(400).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "Year must be a valid integer",
-			Metadata: map[string]interface{}{
-				"error_type":    "ValidationError",
-				"provided_year": yearStr,
+			Metadata: models.ErrorMetadata{
+				ErrorType:    "ValidationError",
+				ProvidedYear: yearStr,
 			},
 		})
 	}
 
-	// Validate year range
-	currentYear := time.Now().Year()
+	// Validate year range; now is captured once and reused for the
+	// response timestamps below
+	now := time.Now()
+	currentYear := now.Year()
 	if year < 2000 || year > currentYear+1 {
 		return c.Status(400).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "Year must be between 2000 and " + strconv.Itoa(currentYear+1),
-			Metadata: map[string]interface{}{
-				"error_type":    "ValidationError",
-				"provided_year": year,
+			Metadata: models.ErrorMetadata{
+				ErrorType:    "ValidationError",
+				ProvidedYear: year,
 			},
 		})
 	}
 
-	// Enhanced date format validation
-	dateRegex := regexp.MustCompile(`^\d{4}$`)
-	if !dateRegex.MatchString(date) {
+	// Enhanced date format and range validation
+	if msg := validateDate(date); msg != "" {
 		return c.Status(400).JSON(models.APIResponse{
 			Status:  "error",
-			Message: "Date must be in MMDD format (e.g., 0902 for September 2nd)",
-			Metadata: map[string]interface{}{
-				"error_type":    "ValidationError",
-				"provided_date": date,
+			Message: msg,
+			Metadata: models.ErrorMetadata{
+				ErrorType:    "ValidationError",
+				ProvidedDate: date,
 			},
 		})
 	}
 
-	// Validate date range (month 01-12, day 01-31)
-	if len(date) == 4 {
-		monthStr := date[:2]
-		dayStr := date[2:]
-		
-		month, monthErr := strconv.Atoi(monthStr)
-		day, dayErr := strconv.Atoi(dayStr)
-		
-		if monthErr != nil || dayErr != nil || month < 1 || month > 12 || day < 1 || day > 31 {
-			return c.Status(400).JSON(models.APIResponse{
-				Status:  "error",
-				Message: "Invalid date. Month must be 01-12, day must be 01-31",
-				Metadata: map[string]interface{}{
-					"error_type":    "ValidationError",
-					"provided_date": date,
-				},
-			})
-		}
-	}
-
 	// Scrape content
 	result, err := h.scraperService.ScrapeContent(year, date)
 	if err != nil {
@@ -116,10 +106,10 @@ func (h *SABDAHandler) GetContent(c *fiber.Ctx) error {
 		return c.Status(500).JSON(models.APIResponse{
 			Status:  "error",
 			Message: "Internal server error occurred",
-			Metadata: map[string]interface{}{
-				"error_type":        "ServerException",
-				"client_ip":         c.Locals("client_ip"),
-				"timestamp":         time.Now(),
+			Metadata: models.ErrorMetadata{
+				ErrorType: "ServerException",
+				ClientIP:  getClientIP(c),
+				Timestamp: now,
 			},
 		})
 	}
@@ -129,7 +119,7 @@ func (h *SABDAHandler) GetContent(c *fiber.Ctx) error {
 		metadata.Authenticated = true
 		metadata.AuthMethod = "JWT"
 		metadata.ClientIP = getClientIP(c)
-		metadata.RequestTimestamp = time.Now()
+		metadata.RequestTimestamp = now
 		result.Metadata = metadata
 	}
 
@@ -142,6 +132,148 @@ func (h *SABDAHandler) GetContent(c *fiber.Ctx) error {
 	return c.Status(statusCode).JSON(result)
 }
 
+// GetBatchContent scrapes SABDA devotional content for several dates of one
+// year. Cached dates are served directly; at most batchMaxMisses uncached
+// dates are scraped and the rest are returned with a retry_later status.
+func (h *SABDAHandler) GetBatchContent(c *fiber.Ctx) error {
+	var req models.BatchRequest
+	if err := c.BodyParser(&req); err != nil {
+		return c.Status(400).JSON(models.APIResponse{
+			Status:  "error",
+			Message: "Invalid request body",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "ValidationError",
+			},
+		})
+	}
+
+	if len(req.Dates) == 0 || len(req.Dates) > batchMaxDates {
+		return c.Status(400).JSON(models.APIResponse{
+			Status:  "error",
+			Message: "Dates must list between 1 and " + strconv.Itoa(batchMaxDates) + " dates in MMDD format",
+			Metadata: models.ErrorMetadata{
+				ErrorType: "ValidationError",
+			},
+		})
+	}
+
+	// Validate year range
+	now := time.Now()
+	currentYear := now.Year()
+	if req.Year < 2000 || req.Year > currentYear+1 {
+		return c.Status(400).JSON(models.APIResponse{
+			Status:  "error",
+			Message: "Year must be between 2000 and " + strconv.Itoa(currentYear+1),
+			Metadata: models.ErrorMetadata{
+				ErrorType:    "ValidationError",
+				ProvidedYear: req.Year,
+			},
+		})
+	}
+
+	// Reject the whole batch up front if any date is malformed
+	for _, date := range req.Dates {
+		if msg := validateDate(date); msg != "" {
+			return c.Status(400).JSON(models.APIResponse{
+				Status:  "error",
+				Message: msg,
+				Metadata: models.ErrorMetadata{
+					ErrorType:    "ValidationError",
+					ProvidedDate: date,
+				},
+			})
+		}
+	}
+
+	// Drop repeated dates, keeping the caller's order, so one URL is never
+	// scraped twice in parallel
+	dates := make([]string, 0, len(req.Dates))
+	seen := make(map[string]struct{}, len(req.Dates))
+	for _, date := range req.Dates {
+		if _, dup := seen[date]; dup {
+			continue
+		}
+		seen[date] = struct{}{}
+		dates = append(dates, date)
+	}
+
+	// Cached dates return immediately; uncached ones beyond the miss budget
+	// are deferred so one request cannot queue a month of upstream fetches
+	results := make([]models.BatchResult, len(dates))
+	misses := 0
+	var wg sync.WaitGroup
+	for i, date := range dates {
+		if !h.scraperService.IsCached(req.Year, date) {
+			if misses >= batchMaxMisses {
+				results[i] = models.BatchResult{
+					Date:    date,
+					Status:  "retry_later",
+					Message: "Content not cached yet; request this date again later",
+				}
+				continue
+			}
+			misses++
+		}
+
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			// recover.New() only guards the handler goroutine; a panic while
+			// extracting one page must not take the server down
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("Batch scraping panic for %d/%s: %v", req.Year, date, r)
+					results[i] = models.BatchResult{
+						Date:    date,
+						Status:  "error",
+						Message: "Internal server error occurred",
+						Metadata: models.ErrorMetadata{
+							ErrorType: "ServerException",
+						},
+					}
+				}
+			}()
+
+			result, err := h.scraperService.ScrapeContent(req.Year, date)
+			if err != nil {
+				log.Printf("Batch scraping error for %d/%s: %v", req.Year, date, err)
+				results[i] = models.BatchResult{
+					Date:    date,
+					Status:  "error",
+					Message: "Internal server error occurred",
+					Metadata: models.ErrorMetadata{
+						ErrorType: "ServerException",
+					},
+				}
+				return
+			}
+			results[i] = models.BatchResult{
+				Date:     date,
+				Status:   result.Status,
+				Message:  result.Message,
+				Data:     result.Data,
+				Metadata: result.Metadata,
+			}
+		}()
+	}
+	wg.Wait()
+
+	log.Printf("Batch request completed for %d dates of %d (%d scraped)", len(dates), req.Year, misses)
+	return c.JSON(models.APIResponse{
+		Status:  "success",
+		Message: "Batch content retrieved",
+		Data:    results,
+		Metadata: models.BatchMetadata{
+			Year:             req.Year,
+			DateCount:        len(dates),
+			Authenticated:    true,
+			AuthMethod:       "JWT",
+			ClientIP:         getClientIP(c),
+			RequestTimestamp: now,
+		},
+	})
+}
+
 // HealthCheck provides a health check endpoint
 func (h *SABDAHandler) HealthCheck(c *fiber.Ctx) error {
 	return c.JSON(models.APIResponse{
@@ -156,50 +288,69 @@ func (h *SABDAHandler) HealthCheck(c *fiber.Ctx) error {
 	})
 }
 
+// homeData is the static API documentation served by Home, encoded once
+var homeData = mustMarshalJSON(map[string]interface{}{
+	"service":  "SABDA Scraper API",
+	"version":  "2.0.0",
+	"language": "Go",
+	"endpoints": map[string]interface{}{
+		"/api/auth/token": map[string]interface{}{
+			"method":      "POST",
+			"description": "Generate authentication token",
+			"body": map[string]string{
+				"api_key": "Your API key (string)",
+			},
+			"example": "POST with {\"api_key\": \"your_api_key\"}",
+		},
+		"/api/sabda": map[string]interface{}{
+			"method":      "GET",
+			"description": "Get SABDA devotional content (requires authentication)",
+			"headers": map[string]string{
+				"Authorization": "Bearer <token>",
+			},
+			"parameters": map[string]string{
+				"year": "Year (integer, e.g., 2025)",
+				"date": "Date in MMDD format (string, e.g., '0902' for September 2nd)",
+			},
+			"example": "/api/sabda?year=2025&date=0902",
+		},
+		"/api/sabda/batch": map[string]interface{}{
+			"method":      "POST",
+			"description": "Get SABDA devotional content for up to 31 dates of one year; at most 4 uncached dates are scraped per request, the rest return status retry_later (requires authentication)",
+			"headers": map[string]string{
+				"Authorization": "Bearer <token>",
+			},
+			"body": map[string]string{
+				"year":  "Year (integer, e.g., 2025)",
+				"dates": "Dates in MMDD format (array of strings, e.g., ['0901', '0902'])",
+			},
+			"example": "POST with {\"year\": 2025, \"dates\": [\"0901\", \"0902\"]}",
+		},
+		"/api/health": map[string]interface{}{
+			"method":      "GET",
+			"description": "Health check endpoint",
+		},
+	},
+	"authentication": map[string]interface{}{
+		"type": "JWT Bearer Token",
+		"flow": "1. POST /api/auth/token with api_key -> 2. Use returned token in Authorization header",
+		"default_api_keys": map[string]string{
+			"flutter_app": "sabda_flutter_2025_secure_key",
+			"mobile_app":  "sabda_mobile_2025_secure_key",
+		},
+	},
+})
+
+// homeCacheControl lets clients and CDNs reuse the documentation response
+const homeCacheControl = "public, max-age=3600"
+
 // Home provides API documentation
 func (h *SABDAHandler) Home(c *fiber.Ctx) error {
+	c.Set(fiber.HeaderCacheControl, homeCacheControl)
 	return c.JSON(models.APIResponse{
 		Status:  "success",
 		Message: "API documentation retrieved successfully",
-		Data: map[string]interface{}{
-			"service": "SABDA Scraper API",
-			"version": "2.0.0",
-			"language": "Go",
-			"endpoints": map[string]interface{}{
-				"/api/auth/token": map[string]interface{}{
-					"method":      "POST",
-					"description": "Generate authentication token",
-					"body": map[string]string{
-						"api_key": "Your API key (string)",
-					},
-					"example": "POST with {\"api_key\": \"your_api_key\"}",
-				},
-				"/api/sabda": map[string]interface{}{
-					"method":      "GET",
-					"description": "Get SABDA devotional content (requires authentication)",
-					"headers": map[string]string{
-						"Authorization": "Bearer <token>",
-					},
-					"parameters": map[string]string{
-						"year": "Year (integer, e.g., 2025)",
-						"date": "Date in MMDD format (string, e.g., '0902' for September 2nd)",
-					},
-					"example": "/api/sabda?year=2025&date=0902",
-				},
-				"/api/health": map[string]interface{}{
-					"method":      "GET",
-					"description": "Health check endpoint",
-				},
-			},
-			"authentication": map[string]interface{}{
-				"type": "JWT Bearer Token",
-				"flow": "1. POST /api/auth/token with api_key -> 2. Use returned token in Authorization header",
-				"default_api_keys": map[string]string{
-					"flutter_app": "sabda_flutter_2025_secure_key",
-					"mobile_app":  "sabda_mobile_2025_secure_key",
-				},
-			},
-		},
+		Data:    homeData,
 		Metadata: map[string]interface{}{
 			"timestamp":     time.Now(),
 			"cors_enabled":  true,
@@ -209,6 +360,36 @@ func (h *SABDAHandler) Home(c *fiber.Ctx) error {
 	})
 }
 
+// validateDate checks an MMDD date and returns the validation message, or
+// "" when the date is valid
+func validateDate(date string) string {
+	if !isFourDigits(date) {
+		return "Date must be in MMDD format (e.g., 0902 for September 2nd)"
+	}
+
+	// Validate date range (month 01-12, day 01-31); isFourDigits guarantees four digits
+	month := int(date[0]-'0')*10 + int(date[1]-'0')
+	day := int(date[2]-'0')*10 + int(date[3]-'0')
+	if month < 1 || month > 12 || day < 1 || day > 31 {
+		return "Invalid date. Month must be 01-12, day must be 01-31"
+	}
+	return ""
+}
+
+// isFourDigits reports whether s is exactly four ASCII digits, the shape of
+// an MMDD date
+func isFourDigits(s string) bool {
+	if len(s) != 4 {
+		return false
+	}
+	for i := 0; i < len(s); i++ {
+		if s[i] < '0' || s[i] > '9' {
+			return false
+		}
+	}
+	return true
+}
+
 func joinStrings(strs []string, separator string) string {
 	if len(strs) == 0 {
 		return ""
@@ -222,4 +403,13 @@ func joinStrings(strs []string, separator string) string {
 		result += separator + strs[i]
 	}
 	return result
+}
+
+// mustMarshalJSON encodes static response data at package init
+func mustMarshalJSON(v interface{}) json.RawMessage {
+	data, err := json.Marshal(v)
+	if err != nil {
+		panic(err)
+	}
+	return data
 }
\ No newline at end of file
@@ -0,0 +1,60 @@
+package handlers
+
+import "testing"
+
+func TestIsFourDigits(t *testing.T) {
+	tests := []struct {
+		input string
+		want  bool
+	}{
+		{"0902", true},
+		{"0000", true},
+		{"9999", true},
+		{"", false},
+		{"902", false},
+		{"09021", false},
+		{"09a2", false},
+		{" 902", false},
+		{"09-2", false},
+		{"０９０２", false}, // fullwidth digits are not ASCII
+		{"٠٩٠٢", false}, // Arabic-Indic digits are not ASCII
+	}
+
+	for _, tt := range tests {
+		if got := isFourDigits(tt.input); got != tt.want {
+			t.Errorf("isFourDigits(%q) = %v, want %v", tt.input, got, tt.want)
+		}
+	}
+}
+
+func TestValidateDate(t *testing.T) {
+	const (
+		formatMsg = "Date must be in MMDD format (e.g., 0902 for September 2nd)"
+		rangeMsg  = "Invalid date. Month must be 01-12, day must be 01-31"
+	)
+
+	tests := []struct {
+		date string
+		want string
+	}{
+		{"0902", ""},
+		{"0101", ""},
+		{"1231", ""},
+		{"0231", ""}, // only the 01-31 day range is checked
+		{"", formatMsg},
+		{"902", formatMsg},
+		{"09022", formatMsg},
+		{"ab12", formatMsg},
+		{"0000", rangeMsg},
+		{"0001", rangeMsg},
+		{"0100", rangeMsg},
+		{"1301", rangeMsg},
+		{"0132", rangeMsg},
+	}
+
+	for _, tt := range tests {
+		if got := validateDate(tt.date); got != tt.want {
+			t.Errorf("validateDate(%q) = %q, want %q", tt.date, got, tt.want)
+		}
+	}
+}
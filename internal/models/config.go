@@ -33,6 +33,7 @@ type CacheConfig struct {
 	TTLSeconds int           `mapstructure:"ttl_seconds"`
 	TTL        time.Duration `mapstructure:"-"`
 	MaxSize    int           `mapstructure:"max_size"`
+	Prewarm    bool          `mapstructure:"prewarm"`
 }
 
 // RateConfig represents rate limiting configuration
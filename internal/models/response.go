@@ -33,6 +33,41 @@ type ScrapingMetadata struct {
 	RequestTimestamp time.Time `json:"request_timestamp,omitempty"`
 }
 
+// ErrorMetadata represents metadata attached to error responses
+type ErrorMetadata struct {
+	ClientIP     string      `json:"client_ip,omitempty"`
+	ErrorType    string      `json:"error_type"`
+	ProvidedDate string      `json:"provided_date,omitempty"`
+	ProvidedYear interface{} `json:"provided_year,omitempty"`
+	Timestamp    time.Time   `json:"timestamp,omitzero"`
+	URL          string      `json:"url,omitempty"`
+}
+
+// BatchRequest represents a request for several dates of one year
+type BatchRequest struct {
+	Year  int      `json:"year"`
+	Dates []string `json:"dates"`
+}
+
+// BatchResult represents the outcome for one date of a batch request
+type BatchResult struct {
+	Date     string      `json:"date"`
+	Status   string      `json:"status"`
+	Message  string      `json:"message"`
+	Data     interface{} `json:"data,omitempty"`
+	Metadata interface{} `json:"metadata,omitempty"`
+}
+
+// BatchMetadata represents metadata for batch requests
+type BatchMetadata struct {
+	Year             int       `json:"year"`
+	DateCount        int       `json:"date_count"`
+	Authenticated    bool      `json:"authenticated"`
+	AuthMethod       string    `json:"auth_method"`
+	ClientIP         string    `json:"client_ip,omitempty"`
+	RequestTimestamp time.Time `json:"request_timestamp"`
+}
+
 // AuthRequest represents authentication request
 type AuthRequest struct {
 	APIKey string `json:"api_key"`
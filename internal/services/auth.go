@@ -2,64 +2,125 @@ package services
 
 import (
 	"crypto/sha256"
-	"encoding/hex"
 	"fmt"
+	"sync"
 	"time"
 
 	"github.com/golang-jwt/jwt/v5"
 )
 
+// Verified tokens are cached briefly so repeat requests skip HS256 checks
+const (
+	verifyCacheTTL     = 30 * time.Second
+	verifyCacheMaxSize = 10000
+)
+
+// Issued tokens are reused until they are this close to expiring
+const tokenRefreshWindow = 5 * time.Minute
+
 // AuthService handles JWT authentication
 type AuthService struct {
-	secretKey  string
+	secretKey  []byte
 	expiration time.Duration
-	apiKeys    map[string]string
+	// apiKeyDigests maps the SHA-256 digest of each valid API key to its
+	// name; keys are matched by digest, never by plaintext compare
+	apiKeyDigests map[[sha256.Size]byte]string
+
+	verified      map[[sha256.Size]byte]verifiedToken
+	verifiedMutex sync.RWMutex
+
+	// issued holds the current token per API key digest; it is bounded by
+	// the number of configured keys
+	issued      map[[sha256.Size]byte]issuedToken
+	issuedMutex sync.Mutex
+}
+
+// issuedToken is a signed token kept for reuse until near expiry
+type issuedToken struct {
+	token     string
+	expiresAt time.Time
+}
+
+// verifiedToken is a cached successful token verification
+type verifiedToken struct {
+	claims    jwt.MapClaims
+	expiresAt time.Time
 }
 
 // NewAuthService creates a new authentication service
 func NewAuthService(secretKey string, expiration time.Duration, apiKeys map[string]string) *AuthService {
-	return &AuthService{
-		secretKey:  secretKey,
-		expiration: expiration,
-		apiKeys:    apiKeys,
+	a := &AuthService{
+		secretKey:     []byte(secretKey),
+		expiration:    expiration,
+		apiKeyDigests: make(map[[sha256.Size]byte]string, len(apiKeys)),
+		verified:      make(map[[sha256.Size]byte]verifiedToken),
+		issued:        make(map[[sha256.Size]byte]issuedToken, len(apiKeys)),
+	}
+
+	for name, key := range apiKeys {
+		a.apiKeyDigests[sha256.Sum256([]byte(key))] = name
 	}
+
+	return a
 }
 
 // GenerateToken generates a JWT token for the given API key
 func (a *AuthService) GenerateToken(apiKey string) (string, time.Time, error) {
 	// Validate API key
-	if !a.isValidAPIKey(apiKey) {
+	digest := sha256.Sum256([]byte(apiKey))
+	keyName, ok := a.apiKeyDigests[digest]
+	if !ok {
 		return "", time.Time{}, fmt.Errorf("invalid API key")
 	}
 
-	// Create token claims
 	now := time.Now()
+
+	a.issuedMutex.Lock()
+	defer a.issuedMutex.Unlock()
+
+	// Reuse the last token while it has comfortably long left to live
+	if cached, exists := a.issued[digest]; exists && cached.expiresAt.Sub(now) > tokenRefreshWindow {
+		return cached.token, cached.expiresAt, nil
+	}
+
+	// Create token claims
 	expiresAt := now.Add(a.expiration)
 
 	claims := jwt.MapClaims{
-		"api_key": a.hashAPIKey(apiKey),
-		"exp":     expiresAt.Unix(),
-		"iat":     now.Unix(),
+		"sub": keyName,
+		"exp": expiresAt.Unix(),
+		"iat": now.Unix(),
 	}
 
 	// Create token
 	token := jwt.NewWithClaims(jwt.SigningMethodHS256, claims)
-	tokenString, err := token.SignedString([]byte(a.secretKey))
+	tokenString, err := token.SignedString(a.secretKey)
 	if err != nil {
 		return "", time.Time{}, fmt.Errorf("failed to sign token: %w", err)
 	}
 
+	a.issued[digest] = issuedToken{
+		token:     tokenString,
+		expiresAt: expiresAt,
+	}
+
 	return tokenString, expiresAt, nil
 }
 
 // VerifyToken verifies and parses a JWT token
 func (a *AuthService) VerifyToken(tokenString string) (*jwt.MapClaims, error) {
+	// Key by digest so raw tokens are never held in memory
+	key := sha256.Sum256([]byte(tokenString))
+	if claims, ok := a.cachedClaims(key); ok {
+		return &claims, nil
+	}
+
 	token, err := jwt.Parse(tokenString, func(token *jwt.Token) (interface{}, error) {
 		// Validate signing method
 		if _, ok := token.Method.(*jwt.SigningMethodHMAC); !ok {
 			return nil, fmt.Errorf("unexpected signing method: %v", token.Header["alg"])
 		}
-		return []byte(a.secretKey), nil
+		return a.secretKey, nil
 	})
 
 	if err != nil {
@@ -75,24 +136,55 @@ func (a *AuthService) VerifyToken(tokenString string) (*jwt.MapClaims, error) {
 		return nil, fmt.Errorf("invalid token claims")
 	}
 
+	a.cacheClaims(key, claims)
+
 	return &claims, nil
 }
 
-// IsValidAPIKey checks if the provided API key is valid
-func (a *AuthService) IsValidAPIKey(apiKey string) bool {
-	return a.isValidAPIKey(apiKey)
+func (a *AuthService) cachedClaims(key [sha256.Size]byte) (jwt.MapClaims, bool) {
+	a.verifiedMutex.RLock()
+	entry, exists := a.verified[key]
+	a.verifiedMutex.RUnlock()
+
+	if !exists || !time.Now().Before(entry.expiresAt) {
+		return nil, false
+	}
+	return entry.claims, true
 }
 
-func (a *AuthService) isValidAPIKey(apiKey string) bool {
-	for _, validKey := range a.apiKeys {
-		if apiKey == validKey {
-			return true
+func (a *AuthService) cacheClaims(key [sha256.Size]byte, claims jwt.MapClaims) {
+	now := time.Now()
+	expiresAt := now.Add(verifyCacheTTL)
+	if exp, err := claims.GetExpirationTime(); err == nil && exp != nil && exp.Before(expiresAt) {
+		expiresAt = exp.Time
+	}
+
+	a.verifiedMutex.Lock()
+	defer a.verifiedMutex.Unlock()
+
+	if len(a.verified) >= verifyCacheMaxSize {
+		for k, entry := range a.verified {
+			if !now.Before(entry.expiresAt) {
+				delete(a.verified, k)
+			}
+		}
+		if len(a.verified) >= verifyCacheMaxSize {
+			a.verified = make(map[[sha256.Size]byte]verifiedToken)
 		}
 	}
-	return false
+
+	a.verified[key] = verifiedToken{
+		claims:    claims,
+		expiresAt: expiresAt,
+	}
+}
+
+// IsValidAPIKey checks if the provided API key is valid
+func (a *AuthService) IsValidAPIKey(apiKey string) bool {
+	return a.isValidAPIKey(apiKey)
 }
 
-func (a *AuthService) hashAPIKey(apiKey string) string {
-	hash := sha256.Sum256([]byte(apiKey))
-	return hex.EncodeToString(hash[:])
+func (a *AuthService) isValidAPIKey(apiKey string) bool {
+	_, ok := a.apiKeyDigests[sha256.Sum256([]byte(apiKey))]
+	return ok
 }
\ No newline at end of file
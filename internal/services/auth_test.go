@@ -0,0 +1,63 @@
+package services
+
+import (
+	"crypto/sha256"
+	"testing"
+	"time"
+
+	"github.com/golang-jwt/jwt/v5"
+)
+
+func TestCacheClaimsExpiry(t *testing.T) {
+	now := time.Now()
+	soon := now.Add(verifyCacheTTL / 2).Truncate(time.Second)
+
+	tests := []struct {
+		name   string
+		claims jwt.MapClaims
+		// wantExp is the expected cache expiry; zero means now+verifyCacheTTL
+		wantExp time.Time
+	}{
+		{"no exp claim", jwt.MapClaims{}, time.Time{}},
+		{"exp after the cache TTL", jwt.MapClaims{"exp": float64(now.Add(time.Hour).Unix())}, time.Time{}},
+		{"exp before the cache TTL is clamped", jwt.MapClaims{"exp": float64(soon.Unix())}, soon},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			a := NewAuthService("secret", time.Hour, nil)
+			key := sha256.Sum256([]byte(tt.name))
+
+			before := time.Now()
+			a.cacheClaims(key, tt.claims)
+			after := time.Now()
+
+			got := a.verified[key].expiresAt
+			if !tt.wantExp.IsZero() {
+				if !got.Equal(tt.wantExp) {
+					t.Errorf("expiresAt = %v, want %v", got, tt.wantExp)
+				}
+				return
+			}
+			if got.Before(before.Add(verifyCacheTTL)) || got.After(after.Add(verifyCacheTTL)) {
+				t.Errorf("expiresAt = %v, want about %v", got, before.Add(verifyCacheTTL))
+			}
+		})
+	}
+}
+
+func TestCachedClaimsExpired(t *testing.T) {
+	a := NewAuthService("secret", time.Hour, nil)
+	key := sha256.Sum256([]byte("token"))
+
+	// A token whose exp has passed must not be served from the cache
+	a.cacheClaims(key, jwt.MapClaims{"exp": float64(time.Now().Add(-time.Second).Unix())})
+	if _, found := a.cachedClaims(key); found {
+		t.Error("cachedClaims found an entry past its exp, want miss")
+	}
+
+	a.cacheClaims(key, jwt.MapClaims{"exp": float64(time.Now().Add(time.Hour).Unix())})
+	if _, found := a.cachedClaims(key); !found {
+		t.Error("cachedClaims missed a fresh entry, want hit")
+	}
+}
@@ -1,24 +1,34 @@
 package services
 
 import (
+	"container/list"
 	"sync"
 	"time"
 
 	"github.com/pranahonk/sabda-scraper-go/internal/models"
 )
 
-// CacheService handles content caching
+// CacheService handles content caching with LRU eviction
 type CacheService struct {
-	cache   map[string]models.CacheItem
-	mutex   sync.RWMutex
+	cache   map[string]*list.Element
+	order   *list.List // front is most recently used
+	mutex   sync.Mutex
 	ttl     time.Duration
 	maxSize int
 }
 
+// cacheEntry is the value stored in each LRU list element
+type cacheEntry struct {
+	key       string
+	item      models.CacheItem
+	expiresAt time.Time
+}
+
 // NewCacheService creates a new cache service
 func NewCacheService(ttl time.Duration, maxSize int) *CacheService {
 	service := &CacheService{
-		cache:   make(map[string]models.CacheItem),
+		cache:   make(map[string]*list.Element),
+		order:   list.New(),
 		ttl:     ttl,
 		maxSize: maxSize,
 	}
@@ -31,36 +41,61 @@ func NewCacheService(ttl time.Duration, maxSize int) *CacheService {
 
 // Get retrieves content from cache
 func (c *CacheService) Get(key string) (*models.DevotionalContent, bool) {
-	c.mutex.RLock()
-	defer c.mutex.RUnlock()
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
 
-	item, exists := c.cache[key]
+	elem, exists := c.cache[key]
 	if !exists {
 		return nil, false
 	}
 
+	entry := elem.Value.(*cacheEntry)
+
 	// Check if expired
-	if time.Since(item.Timestamp) > c.ttl {
+	if time.Now().After(entry.expiresAt) {
+		c.removeElement(elem)
 		return nil, false
 	}
 
-	return &item.Content, true
+	c.order.MoveToFront(elem)
+	content := entry.item.Content
+	return &content, true
 }
 
-// Set stores content in cache
+// Set stores content in cache for the configured TTL
 func (c *CacheService) Set(key string, content models.DevotionalContent) {
+	c.SetWithTTL(key, content, c.ttl)
+}
+
+// SetWithTTL stores content in cache for the given TTL instead of the
+// configured one
+func (c *CacheService) SetWithTTL(key string, content models.DevotionalContent, ttl time.Duration) {
 	c.mutex.Lock()
 	defer c.mutex.Unlock()
 
-	// Remove oldest entries if cache is full
-	if len(c.cache) >= c.maxSize {
-		c.removeOldest()
+	now := time.Now()
+	item := models.CacheItem{
+		Content:   content,
+		Timestamp: now,
+	}
+	expiresAt := now.Add(ttl)
+
+	if elem, exists := c.cache[key]; exists {
+		entry := elem.Value.(*cacheEntry)
+		entry.item = item
+		entry.expiresAt = expiresAt
+		c.order.MoveToFront(elem)
+		return
 	}
 
-	c.cache[key] = models.CacheItem{
-		Content:   content,
-		Timestamp: time.Now(),
+	// Evict the least recently used entry if cache is full
+	if c.order.Len() >= c.maxSize {
+		if oldest := c.order.Back(); oldest != nil {
+			c.removeElement(oldest)
+		}
 	}
+
+	c.cache[key] = c.order.PushFront(&cacheEntry{key: key, item: item, expiresAt: expiresAt})
 }
 
 // Clear removes all items from cache
@@ -68,31 +103,21 @@ func (c *CacheService) Clear() {
 	c.mutex.Lock()
 	defer c.mutex.Unlock()
 
-	c.cache = make(map[string]models.CacheItem)
+	c.cache = make(map[string]*list.Element)
+	c.order.Init()
 }
 
 // Size returns the current cache size
 func (c *CacheService) Size() int {
-	c.mutex.RLock()
-	defer c.mutex.RUnlock()
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
 
-	return len(c.cache)
+	return c.order.Len()
 }
 
-func (c *CacheService) removeOldest() {
-	var oldestKey string
-	var oldestTime time.Time
-
-	for key, item := range c.cache {
-		if oldestKey == "" || item.Timestamp.Before(oldestTime) {
-			oldestKey = key
-			oldestTime = item.Timestamp
-		}
-	}
-
-	if oldestKey != "" {
-		delete(c.cache, oldestKey)
-	}
+func (c *CacheService) removeElement(elem *list.Element) {
+	c.order.Remove(elem)
+	delete(c.cache, elem.Value.(*cacheEntry).key)
 }
 
 func (c *CacheService) cleanupExpired() {
@@ -104,12 +129,14 @@ func (c *CacheService) cleanupExpired() {
 		case <-ticker.C:
 			c.mutex.Lock()
 			now := time.Now()
-			for key, item := range c.cache {
-				if now.Sub(item.Timestamp) > c.ttl {
-					delete(c.cache, key)
+			for elem := c.order.Back(); elem != nil; {
+				prev := elem.Prev()
+				if now.After(elem.Value.(*cacheEntry).expiresAt) {
+					c.removeElement(elem)
 				}
+				elem = prev
 			}
 			c.mutex.Unlock()
 		}
 	}
-}
\ No newline at end of file
+}
@@ -0,0 +1,116 @@
+package services
+
+import (
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/pranahonk/sabda-scraper-go/internal/models"
+)
+
+func TestCacheServiceLRU(t *testing.T) {
+	tests := []struct {
+		name    string
+		maxSize int
+		steps   []string // "set:<key>" or "get:<key>"
+		present []string
+		absent  []string
+	}{
+		{
+			name:    "set evicts from the back",
+			maxSize: 2,
+			steps:   []string{"set:a", "set:b", "set:c"},
+			present: []string{"b", "c"},
+			absent:  []string{"a"},
+		},
+		{
+			name:    "get promotes an entry",
+			maxSize: 2,
+			steps:   []string{"set:a", "set:b", "get:a", "set:c"},
+			present: []string{"a", "c"},
+			absent:  []string{"b"},
+		},
+		{
+			name:    "set on an existing key promotes it without evicting",
+			maxSize: 2,
+			steps:   []string{"set:a", "set:b", "set:a", "set:c"},
+			present: []string{"a", "c"},
+			absent:  []string{"b"},
+		},
+		{
+			name:    "get of a missing key changes nothing",
+			maxSize: 2,
+			steps:   []string{"set:a", "set:b", "get:x", "set:c"},
+			present: []string{"b", "c"},
+			absent:  []string{"a", "x"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			c := NewCacheService(time.Hour, tt.maxSize)
+			for _, step := range tt.steps {
+				op, key, _ := strings.Cut(step, ":")
+				switch op {
+				case "set":
+					c.Set(key, models.DevotionalContent{Title: key})
+				case "get":
+					c.Get(key)
+				}
+			}
+
+			// Check absent keys first; Get on a present key promotes it
+			for _, key := range tt.absent {
+				if _, found := c.Get(key); found {
+					t.Errorf("Get(%q) found, want evicted", key)
+				}
+			}
+			for _, key := range tt.present {
+				got, found := c.Get(key)
+				if !found {
+					t.Errorf("Get(%q) not found, want present", key)
+					continue
+				}
+				if got.Title != key {
+					t.Errorf("Get(%q).Title = %q, want %q", key, got.Title, key)
+				}
+			}
+			if size := c.Size(); size != len(tt.present) {
+				t.Errorf("Size() = %d, want %d", size, len(tt.present))
+			}
+		})
+	}
+}
+
+func TestCacheServiceTTL(t *testing.T) {
+	tests := []struct {
+		name       string
+		defaultTTL time.Duration
+		entryTTL   time.Duration // zero uses Set and the default TTL
+		wantFound  bool
+	}{
+		{"default TTL not yet expired", time.Hour, 0, true},
+		{"default TTL expired", -time.Second, 0, false},
+		{"entry TTL outlives an expired default", -time.Second, time.Hour, true},
+		{"entry TTL expires before the default", time.Hour, -time.Second, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			c := NewCacheService(tt.defaultTTL, 10)
+			if tt.entryTTL == 0 {
+				c.Set("key", models.DevotionalContent{})
+			} else {
+				c.SetWithTTL("key", models.DevotionalContent{}, tt.entryTTL)
+			}
+
+			if _, found := c.Get("key"); found != tt.wantFound {
+				t.Errorf("Get found = %v, want %v", found, tt.wantFound)
+			}
+			// Expired entries are dropped on lookup
+			if !tt.wantFound && c.Size() != 0 {
+				t.Errorf("Size() = %d after expired Get, want 0", c.Size())
+			}
+		})
+	}
+}
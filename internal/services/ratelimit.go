@@ -1,12 +1,16 @@
 package services
 
 import (
+	"slices"
 	"sync"
 	"time"
 
 	"github.com/pranahonk/sabda-scraper-go/internal/models"
 )
 
+// rateLimitMaxClients caps tracked clients between cleanup sweeps
+const rateLimitMaxClients = 100000
+
 // RateLimitService handles rate limiting
 type RateLimitService struct {
 	clients    map[string]*models.RateLimitInfo
@@ -39,6 +43,9 @@ func (r *RateLimitService) IsAllowed(clientIP string) bool {
 	// Get or create client info
 	client, exists := r.clients[clientIP]
 	if !exists {
+		if len(r.clients) >= rateLimitMaxClients {
+			r.evictClients(now)
+		}
 		client = &models.RateLimitInfo{
 			ClientIP:  clientIP,
 			Requests:  make([]time.Time, 0),
@@ -47,13 +54,7 @@ func (r *RateLimitService) IsAllowed(clientIP string) bool {
 	}
 
 	// Clean old requests outside the window
-	var validRequests []time.Time
-	for _, reqTime := range client.Requests {
-		if now.Sub(reqTime) < r.window {
-			validRequests = append(validRequests, reqTime)
-		}
-	}
-	client.Requests = validRequests
+	client.Requests = r.pruneRequests(client.Requests, now)
 
 	// Check if limit exceeded
 	if len(client.Requests) >= r.maxReqs {
@@ -75,15 +76,7 @@ func (r *RateLimitService) GetRequestCount(clientIP string) int {
 		return 0
 	}
 
-	now := time.Now()
-	count := 0
-	for _, reqTime := range client.Requests {
-		if now.Sub(reqTime) < r.window {
-			count++
-		}
-	}
-	
-	return count
+	return len(client.Requests) - r.expiredCount(client.Requests, time.Now())
 }
 
 // Reset clears all rate limit data for a client
@@ -114,22 +107,62 @@ func (r *RateLimitService) cleanup() {
 			
 			for clientIP, client := range r.clients {
 				// Clean old requests
-				var validRequests []time.Time
-				for _, reqTime := range client.Requests {
-					if now.Sub(reqTime) < r.window {
-						validRequests = append(validRequests, reqTime)
-					}
-				}
+				client.Requests = r.pruneRequests(client.Requests, now)
 				
-				if len(validRequests) == 0 {
+				if len(client.Requests) == 0 {
 					// Remove client if no recent requests
 					delete(r.clients, clientIP)
-				} else {
-					client.Requests = validRequests
 				}
 			}
 			
 			r.mutex.Unlock()
 		}
 	}
+}
+
+// evictClients makes room for new clients. Clients with no requests left
+// in the window are dropped first; if every client is still active, the 1%
+// least recently seen go so the next inserts do not rescan the whole map.
+func (r *RateLimitService) evictClients(now time.Time) {
+	type lastSeen struct {
+		clientIP string
+		at       time.Time
+	}
+	active := make([]lastSeen, 0, len(r.clients))
+	for clientIP, client := range r.clients {
+		if r.expiredCount(client.Requests, now) == len(client.Requests) {
+			delete(r.clients, clientIP)
+			continue
+		}
+		active = append(active, lastSeen{clientIP, client.Requests[len(client.Requests)-1]})
+	}
+	if len(r.clients) < rateLimitMaxClients {
+		return
+	}
+	slices.SortFunc(active, func(a, b lastSeen) int {
+		return a.at.Compare(b.at)
+	})
+	for _, client := range active[:rateLimitMaxClients/100] {
+		delete(r.clients, client.clientIP)
+	}
+}
+
+// expiredCount returns how many leading timestamps fell out of the window.
+// Requests are appended in time order, so expired ones always form a prefix.
+func (r *RateLimitService) expiredCount(requests []time.Time, now time.Time) int {
+	i := 0
+	for i < len(requests) && now.Sub(requests[i]) >= r.window {
+		i++
+	}
+	return i
+}
+
+// pruneRequests drops expired timestamps in place, reusing the backing array
+func (r *RateLimitService) pruneRequests(requests []time.Time, now time.Time) []time.Time {
+	expired := r.expiredCount(requests, now)
+	if expired == 0 {
+		return requests
+	}
+	n := copy(requests, requests[expired:])
+	return requests[:n]
 }
\ No newline at end of file
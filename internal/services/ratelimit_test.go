@@ -0,0 +1,78 @@
+package services
+
+import (
+	"strconv"
+	"testing"
+	"time"
+
+	"github.com/pranahonk/sabda-scraper-go/internal/models"
+)
+
+func TestEvictClients(t *testing.T) {
+	const window = time.Minute
+	now := time.Now()
+	evictCount := rateLimitMaxClients / 100
+
+	tests := []struct {
+		name    string
+		expired int // clients whose only request fell out of the window
+		absent  []string
+		present []string
+		wantLen int
+	}{
+		{
+			name:    "expired clients are dropped first",
+			expired: 10,
+			absent:  []string{"expired-0", "expired-9"},
+			present: []string{"active-10", "busy"},
+			wantLen: rateLimitMaxClients - 10,
+		},
+		{
+			name:    "least recently seen active clients are evicted",
+			absent:  []string{"active-0", "active-" + strconv.Itoa(evictCount-1)},
+			present: []string{"active-" + strconv.Itoa(evictCount), "busy"},
+			wantLen: rateLimitMaxClients - evictCount,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			r := &RateLimitService{
+				clients: make(map[string]*models.RateLimitInfo, rateLimitMaxClients),
+				maxReqs: 10,
+				window:  window,
+			}
+			// "busy" made its first request before anyone else but is still
+			// sending; its last request, not its first, decides eviction
+			r.clients["busy"] = &models.RateLimitInfo{
+				ClientIP: "busy",
+				Requests: []time.Time{now.Add(-window + time.Second), now},
+			}
+			for i := 0; len(r.clients) < rateLimitMaxClients; i++ {
+				ip := "active-" + strconv.Itoa(i)
+				last := now.Add(-window / 2).Add(time.Duration(i) * time.Microsecond)
+				if i < tt.expired {
+					ip = "expired-" + strconv.Itoa(i)
+					last = now.Add(-window)
+				}
+				r.clients[ip] = &models.RateLimitInfo{ClientIP: ip, Requests: []time.Time{last}}
+			}
+
+			r.evictClients(now)
+
+			if len(r.clients) != tt.wantLen {
+				t.Errorf("len(clients) = %d, want %d", len(r.clients), tt.wantLen)
+			}
+			for _, ip := range tt.absent {
+				if _, ok := r.clients[ip]; ok {
+					t.Errorf("client %q kept, want evicted", ip)
+				}
+			}
+			for _, ip := range tt.present {
+				if _, ok := r.clients[ip]; !ok {
+					t.Errorf("client %q evicted, want kept", ip)
+				}
+			}
+		})
+	}
+}
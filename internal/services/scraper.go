@@ -3,12 +3,17 @@ package services
 import (
 	"fmt"
 	"log"
+	"strconv"
 	"time"
 
 	"github.com/pranahonk/sabda-scraper-go/internal/models"
 	"github.com/pranahonk/sabda-scraper-go/pkg/scraper"
 )
 
+// pastContentTTL is how long content for dates before today stays cached;
+// published devotionals for past dates no longer change
+const pastContentTTL = 30 * 24 * time.Hour
+
 // ScraperService handles scraping operations with caching
 type ScraperService struct {
 	scraper *scraper.SABDAScraper
@@ -27,7 +32,7 @@ func NewScraperService(debug bool, cache *CacheService) *ScraperService {
 func (s *ScraperService) ScrapeContent(year int, date string) (*models.APIResponse, error) {
 	// Create cache key
 	formattedDate := fmt.Sprintf("%04s", date)
-	cacheKey := fmt.Sprintf("sabda_%d_%s", year, formattedDate)
+	cacheKey := contentCacheKey(year, formattedDate)
 
 	// Check cache first
 	if cached, found := s.cache.Get(cacheKey); found {
@@ -46,21 +51,35 @@ func (s *ScraperService) ScrapeContent(year int, date string) (*models.APIRespon
 		}, nil
 	}
 
+	return s.fetch(year, formattedDate)
+}
+
+// fetch scrapes the MMDD date of year upstream, without consulting the
+// cache, and caches the result
+func (s *ScraperService) fetch(year int, formattedDate string) (*models.APIResponse, error) {
+	cacheKey := contentCacheKey(year, formattedDate)
+
 	// Scrape content
-	content, err := s.scraper.ScrapeContent(year, date)
+	content, err := s.scraper.ScrapeContent(year, formattedDate)
 	if err != nil {
 		return &models.APIResponse{
 			Status:  "error",
 			Message: fmt.Sprintf("Scraping failed: %v", err),
-			Metadata: map[string]interface{}{
-				"url":        fmt.Sprintf("https://www.sabda.org/publikasi/e-sh/cetak/?tahun=%d&edisi=%s", year, formattedDate),
-				"error_type": "ScrapingException",
+			Metadata: models.ErrorMetadata{
+				URL:       fmt.Sprintf("https://www.sabda.org/publikasi/e-sh/cetak/?tahun=%d&edisi=%s", year, formattedDate),
+				ErrorType: "ScrapingException",
 			},
 		}, err
 	}
 
-	// Cache the result
-	s.cache.Set(cacheKey, *content)
+	// Cache the result; past dates are immutable and kept much longer, but
+	// only when the page actually yielded content. An empty result may be an
+	// interstitial or a layout miss and keeps the short configured TTL.
+	if len(content.DevotionalContent) > 0 && isPastDate(year, formattedDate, time.Now()) {
+		s.cache.SetWithTTL(cacheKey, *content, pastContentTTL)
+	} else {
+		s.cache.Set(cacheKey, *content)
+	}
 
 	return &models.APIResponse{
 		Status:  "success",
@@ -73,4 +92,83 @@ func (s *ScraperService) ScrapeContent(year int, date string) (*models.APIRespon
 			ScrapedAt: time.Now(),
 		},
 	}, nil
+}
+
+// IsCached reports whether content for the MMDD date of year is cached
+func (s *ScraperService) IsCached(year int, date string) bool {
+	_, found := s.cache.Get(contentCacheKey(year, fmt.Sprintf("%04s", date)))
+	return found
+}
+
+// contentCacheKey returns the cache key for the MMDD date of year
+func contentCacheKey(year int, date string) string {
+	return fmt.Sprintf("sabda_%d_%s", year, date)
+}
+
+// isPastDate reports whether the MMDD date of year falls before today
+func isPastDate(year int, date string, now time.Time) bool {
+	if len(date) != 4 {
+		return false
+	}
+	month, err := strconv.Atoi(date[:2])
+	if err != nil {
+		return false
+	}
+	day, err := strconv.Atoi(date[2:])
+	if err != nil {
+		return false
+	}
+
+	today := time.Date(now.Year(), now.Month(), now.Day(), 0, 0, 0, 0, now.Location())
+	return time.Date(year, time.Month(month), day, 0, 0, 0, 0, now.Location()).Before(today)
+}
+
+// Prewarm scrapes every date of now's year before today into the cache,
+// one at a time, so later requests for them are served from memory. The
+// scraper's throttle still spaces the upstream requests. Dates already
+// cached with content are skipped; dates cached without content are
+// scraped again past the cache. A scrape that errors, panics or yields no
+// paragraphs counts as a failure.
+func (s *ScraperService) Prewarm(now time.Time) {
+	year := now.Year()
+	today := time.Date(year, now.Month(), now.Day(), 0, 0, 0, 0, now.Location())
+	log.Printf("Prewarming cache for %d", year)
+
+	warmed, failed := 0, 0
+	for day := time.Date(year, time.January, 1, 0, 0, 0, 0, now.Location()); day.Before(today); day = day.AddDate(0, 0, 1) {
+		date := fmt.Sprintf("%02d%02d", int(day.Month()), day.Day())
+		if cached, found := s.cache.Get(contentCacheKey(year, date)); found && len(cached.DevotionalContent) > 0 {
+			continue
+		}
+		if s.prewarmDate(year, date) {
+			warmed++
+		} else {
+			failed++
+		}
+	}
+
+	log.Printf("Prewarm for %d finished: %d dates cached, %d failed", year, warmed, failed)
+}
+
+// prewarmDate scrapes one MMDD date past the cache and reports whether it
+// yielded content. Prewarm runs outside any request, so an extraction panic
+// is recovered here rather than taking the process down.
+func (s *ScraperService) prewarmDate(year int, date string) (ok bool) {
+	defer func() {
+		if r := recover(); r != nil {
+			log.Printf("Prewarm panic for %d/%s: %v", year, date, r)
+			ok = false
+		}
+	}()
+
+	result, err := s.fetch(year, date)
+	if err != nil {
+		log.Printf("Prewarm failed for %d/%s: %v", year, date, err)
+		return false
+	}
+	if content, isContent := result.Data.(*models.DevotionalContent); !isContent || len(content.DevotionalContent) == 0 {
+		log.Printf("Prewarm got no content for %d/%s", year, date)
+		return false
+	}
+	return true
 }
\ No newline at end of file
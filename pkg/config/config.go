@@ -66,6 +66,7 @@ func setDefaults() {
 	// Cache defaults
 	viper.SetDefault("cache.ttl_seconds", getEnvIntOrDefault("CACHE_TTL", 3600))
 	viper.SetDefault("cache.max_size", getEnvIntOrDefault("CACHE_MAX_SIZE", 1000))
+	viper.SetDefault("cache.prewarm", getEnvBoolOrDefault("CACHE_PREWARM", false))
 	
 	// Rate limiting defaults
 	viper.SetDefault("rate.max_requests_per_minute", getEnvIntOrDefault("MAX_REQUESTS_PER_MINUTE", 60))
@@ -1,18 +1,85 @@
 package scraper
 
 import (
+	"crypto/tls"
+	"errors"
 	"fmt"
+	"io"
 	"log"
-	"math/rand"
+	"math/rand/v2"
+	"net"
+	"net/http"
 	"regexp"
 	"strings"
+	"sync"
+	"syscall"
 	"time"
+	"unicode"
 	"github.com/PuerkitoBio/goquery"
+	"github.com/andybalholm/cascadia"
 	"github.com/gocolly/colly/v2"
 	"github.com/pranahonk/sabda-scraper-go/internal/models"
 )
 
 
+// Patterns used during extraction, compiled once at package init.
+var (
+	h1ScriptureRegex   = regexp.MustCompile(`\b([A-Za-z]+\s+\d+(?::\d+(?:-\d+)?)?)\b`)
+	textScriptureRegex = regexp.MustCompile(`\b([A-Za-z]+\s+\d+:\d+(?:-\d+)?)\b`)
+	h1TitleRegex       = regexp.MustCompile(`^([A-Za-z]+\s+\d+(?::\d+(?:-\d+)?)?)(.*)`)
+	issueNumberRegex   = regexp.MustCompile(`^-\d+`)
+	titleAfterRefRegex = regexp.MustCompile(`^([A-Za-z][^,.\n]*?)(?:\s|$)`)
+	leadingNumberRegex = regexp.MustCompile(`^-?\d*`)
+	multiSpaceRegex    = regexp.MustCompile(`\s{2,}`)
+	titleLineRegex     = regexp.MustCompile(`^[A-Z][a-zA-Z\s!?]*$`)
+	authorTagRegex     = regexp.MustCompile(`\s*\[[\w\s]+\]\s*$`)
+	sentenceBreakRegex = regexp.MustCompile(`[.!?]\s+`)
+)
+
+// CSS selectors, compiled once instead of on every goquery Find call.
+// net/html lowercases tag names, so "p" also matches <P>.
+var (
+	titleSelector     = cascadia.MustCompile("title")
+	headingSelector   = cascadia.MustCompile("h1")
+	asideSelector     = cascadia.MustCompile("aside.w")
+	paragraphSelector = cascadia.MustCompile("p")
+	wjCellSelector    = cascadia.MustCompile("td.wj")
+	tableCellSelector = cascadia.MustCompile("table td")
+	bodySelector      = cascadia.MustCompile("body")
+)
+
+
+// userAgents is the pool rotated across outgoing requests.
+var userAgents = []string{
+	"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+	"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+	"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+	"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+	"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0",
+	"Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+	"Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:125.0) Gecko/20100101 Firefox/125.0",
+	"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4.1 Safari/605.1.15",
+}
+
+// requestHeaders are the browser-like headers sent with every request,
+// canonicalized once so they can be copied without per-request Set calls.
+// Accept-Encoding is deliberately absent: the transport then asks for gzip
+// itself and decompresses the body transparently.
+var requestHeaders = func() http.Header {
+	h := http.Header{}
+	h.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8")
+	h.Set("Accept-Language", "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7")
+	h.Set("DNT", "1")
+	h.Set("Connection", "keep-alive")
+	h.Set("Upgrade-Insecure-Requests", "1")
+	h.Set("Sec-Fetch-Dest", "document")
+	h.Set("Sec-Fetch-Mode", "navigate")
+	h.Set("Sec-Fetch-Site", "none")
+	h.Set("Cache-Control", "max-age=0")
+	return h
+}()
+
+
 func min(a, b int) int {
 	if a < b {
 		return a
@@ -23,54 +90,82 @@ func min(a, b int) int {
 
 type SABDAScraper struct {
 	collector *colly.Collector
+	debug     bool
+
+	// lastFetch is when the most recently scheduled request may start.
+	lastFetch  time.Time
+	fetchMutex sync.Mutex
+
+	// fetchSlots bounds requests in flight. throttle already spaces request
+	// starts; a few slots let other cache misses proceed past a slow response.
+	fetchSlots chan struct{}
 }
 
+// contentKey is the colly context key holding the per-request result.
+const contentKey = "content"
+
+// Upstream fetch timing. Each request may take at most requestTimeout, and
+// a scrape (direct URL, print URL and any retries) gives up waiting for a
+// fetch slot or its throttle turn once a request could no longer finish
+// inside scrapeBudget. Only transient failures are retried, with a doubling
+// backoff.
+const (
+	requestTimeout = 15 * time.Second
+	scrapeBudget   = 45 * time.Second
+	visitAttempts  = 3
+	retryBackoff   = 300 * time.Millisecond
+	maxInFlight    = 4
+)
+
 
 func New(debug bool) *SABDAScraper {
 	c := colly.NewCollector(
 		colly.UserAgent("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"),
+		// The service cache decides when a date is fetched again.
+		colly.AllowURLRevisit(),
 	)
 
-	
-
-	
-	c.Limit(&colly.LimitRule{
-		DomainGlob:  "*",
-		Parallelism: 1,
-		Delay:       1 * time.Second,
-	})
+	s := &SABDAScraper{
+		collector:  c,
+		debug:      debug,
+		fetchSlots: make(chan struct{}, maxInFlight),
+	}
 
 	
-	c.SetRequestTimeout(30 * time.Second)
 
 	
-	userAgents := []string{
-		"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-		"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-		"Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
-		"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-	}
+	c.SetRequestTimeout(requestTimeout)
+
+	// Devotional pages are tens of KB; cap buffered bodies well below
+	// colly's 10MB default to bound memory per in-flight scrape.
+	c.MaxBodySize = 2 * 1024 * 1024
+
+	// Keep connections to sabda.org alive across scrapes so repeat requests
+	// skip the TCP and TLS handshakes.
+	c.WithTransport(&http.Transport{
+		Proxy: http.ProxyFromEnvironment,
+		DialContext: (&net.Dialer{
+			Timeout:   30 * time.Second,
+			KeepAlive: 30 * time.Second,
+		}).DialContext,
+		// Resume TLS sessions when a pooled connection has to be re-dialed.
+		TLSClientConfig: &tls.Config{
+			ClientSessionCache: tls.NewLRUClientSessionCache(64),
+		},
+		ForceAttemptHTTP2:     true,
+		MaxIdleConns:          100,
+		MaxIdleConnsPerHost:   10,
+		IdleConnTimeout:       90 * time.Second,
+		TLSHandshakeTimeout:   10 * time.Second,
+		ExpectContinueTimeout: 1 * time.Second,
+	})
 
 	
 	c.OnRequest(func(r *colly.Request) {
-		
-		r.Headers.Set("User-Agent", userAgents[rand.Intn(len(userAgents))])
-		
-		
-		r.Headers.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8")
-		r.Headers.Set("Accept-Language", "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7")
-		r.Headers.Set("Accept-Encoding", "gzip, deflate, br")
-		r.Headers.Set("DNT", "1")
-		r.Headers.Set("Connection", "keep-alive")
-		r.Headers.Set("Upgrade-Insecure-Requests", "1")
-		r.Headers.Set("Sec-Fetch-Dest", "document")
-		r.Headers.Set("Sec-Fetch-Mode", "navigate")
-		r.Headers.Set("Sec-Fetch-Site", "none")
-		r.Headers.Set("Cache-Control", "max-age=0")
-
-		
-		delay := time.Duration(rand.Intn(2000)+1000) * time.Millisecond
-		time.Sleep(delay)
+		for key, values := range requestHeaders {
+			(*r.Headers)[key] = values
+		}
+		r.Headers.Set("User-Agent", userAgents[rand.IntN(len(userAgents))])
 	})
 
 	
@@ -78,9 +173,11 @@ func New(debug bool) *SABDAScraper {
 		log.Printf("Error scraping %s: %v", r.Request.URL, err)
 	})
 
-	return &SABDAScraper{
-		collector: c,
-	}
+	// Register the extraction callback once; each request carries its own
+	// result through the colly context instead of adding a new callback.
+	c.OnHTML("html", s.handleHTML)
+
+	return s
 }
 
 
@@ -99,178 +196,300 @@ func (s *SABDAScraper) ScrapeContent(year int, date string) (*models.DevotionalC
 	var content models.DevotionalContent
 	var scrapingError error
 
-	s.collector.OnHTML("html", func(e *colly.HTMLElement) {
-		
-		title := e.ChildText("title")
-		if title == "" {
-			title = "SABDA Devotional"
+	deadline := time.Now().Add(scrapeBudget)
+	err := s.visit(url, &content, deadline)
+	if err != nil || len(content.DevotionalContent) == 0 {
+		log.Printf("Direct URL failed or no content, trying print URL: %s", printURL)
+		if err := s.visit(printURL, &content, deadline); err != nil {
+			return nil, fmt.Errorf("failed to scrape both URLs %s and %s: %w", url, printURL, err)
 		}
-		content.Title = strings.TrimSpace(title)
+	}
 
+	if scrapingError != nil {
+		return nil, scrapingError
+	}
+
+	
+	if content.ScriptureReference == "" && len(content.DevotionalContent) == 0 {
+		log.Printf("Warning: Low quality content extracted from %s", url)
+	}
+
+	return &content, nil
+}
+
+// throttle spaces requests to sabda.org by a random 1-3s gap, sleeping only
+// for whatever part of the gap has not already elapsed since the last fetch.
+// It reports false, without taking a turn, if the request could then no
+// longer finish before deadline.
+func (s *SABDAScraper) throttle(deadline time.Time) bool {
+	gap := time.Duration(rand.IntN(2000)+1000) * time.Millisecond
+
+	s.fetchMutex.Lock()
+	wait := time.Until(s.lastFetch.Add(gap))
+	if wait < 0 {
+		wait = 0
+	}
+	if time.Until(deadline) < wait+requestTimeout {
+		s.fetchMutex.Unlock()
+		return false
+	}
+	s.lastFetch = time.Now().Add(wait)
+	s.fetchMutex.Unlock()
+
+	time.Sleep(wait)
+	return true
+}
+
+// visit fetches url and fills content from the registered HTML callback.
+func (s *SABDAScraper) visit(url string, content *models.DevotionalContent, deadline time.Time) error {
+	var err error
+	for attempt := 0; attempt < visitAttempts; attempt++ {
+		if attempt > 0 {
+			backoff := retryBackoff << (attempt - 1)
+			if time.Until(deadline) < backoff+requestTimeout {
+				return err
+			}
+			log.Printf("Retrying %s after transient error: %v", url, err)
+			time.Sleep(backoff)
+		}
+
+		fetchErr := s.fetch(url, content, deadline)
+		if errors.Is(fetchErr, errBudgetExhausted) && err != nil {
+			// Report why the last real attempt failed, not the wait
+			return err
+		}
+		err = fetchErr
+		if err == nil || !isTransient(err) {
+			return err
+		}
+	}
+	return err
+}
+
+// errBudgetExhausted is returned when a request could not start in time to
+// finish inside the scrape's budget.
+var errBudgetExhausted = errors.New("scrape time budget exhausted")
+
+// fetch performs one request for url once a fetch slot and a throttle turn
+// are available, so the request itself starts with at least requestTimeout
+// left before deadline.
+func (s *SABDAScraper) fetch(url string, content *models.DevotionalContent, deadline time.Time) error {
+	slotWait := time.NewTimer(time.Until(deadline) - requestTimeout)
+	defer slotWait.Stop()
+	select {
+	case s.fetchSlots <- struct{}{}:
+	case <-slotWait.C:
+		return fmt.Errorf("%w waiting to fetch %s", errBudgetExhausted, url)
+	}
+	defer func() { <-s.fetchSlots }()
+
+	if !s.throttle(deadline) {
+		return fmt.Errorf("%w waiting to fetch %s", errBudgetExhausted, url)
+	}
+
+	ctx := colly.NewContext()
+	ctx.Put(contentKey, content)
+	return s.collector.Request("GET", url, nil, ctx, nil)
+}
+
+// isTransient reports whether a fetch error is worth retrying: a reset or
+// truncated connection, or a timeout. DNS, refused-connection, TLS and
+// redirect errors will not clear up within one scrape and are returned as is.
+func isTransient(err error) bool {
+	if errors.Is(err, syscall.ECONNRESET) || errors.Is(err, io.ErrUnexpectedEOF) {
+		return true
+	}
+	var netErr net.Error
+	return errors.As(err, &netErr) && netErr.Timeout()
+}
+
+// handleHTML extracts devotional content from a fetched page.
+func (s *SABDAScraper) handleHTML(e *colly.HTMLElement) {
+	content, ok := e.Response.Ctx.GetAny(contentKey).(*models.DevotionalContent)
+	if !ok {
+		return
+	}
+	url := e.Request.URL.String()
+
+	
+	title := strings.TrimSpace(e.DOM.FindMatcher(titleSelector).Text())
+	if title == "" {
+		title = "SABDA Devotional"
+	}
+	content.Title = strings.TrimSpace(title)
+
+	
+	var mainContent *goquery.Selection
+	// mainText holds mainContent's text when choosing the container already
+	// extracted it, so the subtree is not walked again below.
+	var mainText string
+	
+	
+	if sel := e.DOM.FindMatcher(asideSelector); sel.Length() > 0 {
 		
-		var mainContent *goquery.Selection
-		
-		
-		if sel := e.DOM.Find("aside.w"); sel.Length() > 0 {
+		sel.EachWithBreak(func(i int, aside *goquery.Selection) bool {
+			if aside.FindMatcher(paragraphSelector).Length() > 0 {
+				mainContent = aside
+				return false
+			}
+			return true
+		})
+	}
+	
+	
+	if mainContent == nil {
+		if sel := e.DOM.FindMatcher(wjCellSelector); sel.Length() > 0 {
+			mainContent = sel.First()
+		} else if sel := e.DOM.FindMatcher(tableCellSelector); sel.Length() > 0 {
 			
-			sel.Each(func(i int, aside *goquery.Selection) {
-				if aside.Find("P").Length() > 0 {
-					mainContent = aside
-					return
+			var largestCell *goquery.Selection
+			maxLength := 0
+			sel.Each(func(i int, cell *goquery.Selection) {
+				text := cell.Text()
+				if n := len(strings.TrimSpace(text)); n > maxLength {
+					maxLength = n
+					largestCell = cell
+					mainText = text
 				}
 			})
-		}
-		
-		
-		if mainContent == nil {
-			if sel := e.DOM.Find("td.wj"); sel.Length() > 0 {
-				mainContent = sel.First()
-			} else if sel := e.DOM.Find("table td"); sel.Length() > 0 {
-				
-				var largestCell *goquery.Selection
-				maxLength := 0
-				sel.Each(func(i int, cell *goquery.Selection) {
-					text := strings.TrimSpace(cell.Text())
-					if len(text) > maxLength {
-						maxLength = len(text)
-						largestCell = cell
-					}
-				})
-				if largestCell != nil {
-					mainContent = largestCell
-				}
-			} else {
-				mainContent = e.DOM.Find("body").First()
+			if largestCell != nil {
+				mainContent = largestCell
 			}
+		} else {
+			mainContent = e.DOM.FindMatcher(bodySelector).First()
 		}
+	}
 
-		
-		allText := mainContent.Text()
+	// Skip extraction entirely when the page has no usable container or
+	// text; the caller then falls back to the print URL.
+	if mainContent == nil {
+		return
+	}
+	allText := mainText
+	if allText == "" {
+		allText = mainContent.Text()
+	}
+	if strings.TrimSpace(allText) == "" {
+		return
+	}
+	if s.debug {
+		// Diagnostics only; serializing the subtree is skipped otherwise.
 		log.Printf("Raw text length: %d", len(allText))
 		if len(allText) > 0 {
 			log.Printf("First 500 chars: %s", allText[:min(500, len(allText))])
 		}
-		
-		
 		htmlContent, _ := mainContent.Html()
 		log.Printf("HTML content length: %d", len(htmlContent))
-		
-		lines := strings.Split(allText, "\n")
-		var cleanLines []string
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
-			if line != "" && !s.isHeaderContent(strings.ToLower(line)) {
-				cleanLines = append(cleanLines, line)
+	}
+	
+	// Strip and filter lines straight into one buffer; no split slice or join.
+	var cleanBuilder strings.Builder
+	cleanBuilder.Grow(len(allText))
+	for rest := allText; rest != ""; {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
+		line = strings.TrimSpace(line)
+		if line != "" && !s.isHeaderContent(strings.ToLower(line)) {
+			if cleanBuilder.Len() > 0 {
+				cleanBuilder.WriteByte('\n')
 			}
+			cleanBuilder.WriteString(line)
 		}
-		cleanText := strings.Join(cleanLines, "\n")
+	}
+	cleanText := cleanBuilder.String()
+	if s.debug {
 		log.Printf("Clean text length: %d", len(cleanText))
-		
-		
-		if len(cleanText) < 100 {
-			log.Printf("Warning: Very little content extracted, page might not have loaded properly")
-		}
+	}
+	
+	
+	if len(cleanText) < 100 {
+		log.Printf("Warning: Very little content extracted, page might not have loaded properly")
+	}
 
+	
+	// Look up the heading once; both the reference and title come from it.
+	h1 := e.DOM.FindMatcher(headingSelector)
+	hasH1 := h1.Length() > 0
+	h1Raw := ""
+	if hasH1 {
+		h1Raw = h1.Text()
+	}
+
+	scriptureRef := ""
+	if hasH1 {
+		h1Text := h1Raw
 		
-		scriptureRef := ""
-		if h1 := e.DOM.Find("h1"); h1.Length() > 0 {
-			h1Text := h1.Text()
-			
-			scriptureRegex := regexp.MustCompile(`\b([A-Za-z]+\s+\d+(?::\d+(?:-\d+)?)?)\b`)
-			if match := scriptureRegex.FindStringSubmatch(h1Text); len(match) > 1 {
-				scriptureRef = match[1]
-			}
+		if match := h1ScriptureRegex.FindStringSubmatch(h1Text); len(match) > 1 {
+			scriptureRef = match[1]
 		}
-		
-		
-		if scriptureRef == "" {
-			scriptureRegex := regexp.MustCompile(`\b([A-Za-z]+\s+\d+:\d+(?:-\d+)?)\b`)
-			if match := scriptureRegex.FindStringSubmatch(cleanText); len(match) > 1 {
-				scriptureRef = match[1]
-			}
+	}
+	
+	
+	if scriptureRef == "" {
+		if match := textScriptureRegex.FindStringSubmatch(cleanText); len(match) > 1 {
+			scriptureRef = match[1]
 		}
-		
-		
-		content.ScriptureReference = scriptureRef
+	}
+	
+	
+	content.ScriptureReference = scriptureRef
 
+	
+	devotionalTitle := ""
+	if hasH1 {
+		h1Text := strings.TrimSpace(h1Raw)
 		
-		devotionalTitle := ""
-		if h1 := e.DOM.Find("h1"); h1.Length() > 0 {
-			h1Text := strings.TrimSpace(h1.Text())
-			
-			
-			if scriptureRef == "" {
-				scriptureRegex := regexp.MustCompile(`^([A-Za-z]+\s+\d+(?::\d+(?:-\d+)?)?)(.*)`)
-				if match := scriptureRegex.FindStringSubmatch(h1Text); len(match) > 2 {
-					scriptureRef = strings.TrimSpace(match[1])
-					devotionalTitle = strings.TrimSpace(match[2])
-				}
-			} else {
-				
-				h1Text = strings.ReplaceAll(h1Text, scriptureRef, "")
-				devotionalTitle = strings.TrimSpace(h1Text)
-			}
-			
-			
-			if devotionalTitle != "" {
-				
-				devotionalTitle = regexp.MustCompile(`^-\d+`).ReplaceAllString(devotionalTitle, "")
-				devotionalTitle = strings.TrimSpace(devotionalTitle)
+		
+		if scriptureRef == "" {
+			if match := h1TitleRegex.FindStringSubmatch(h1Text); len(match) > 2 {
+				scriptureRef = strings.TrimSpace(match[1])
+				devotionalTitle = strings.TrimSpace(match[2])
 			}
+		} else {
 			
-			if devotionalTitle != "" && len(devotionalTitle) > 3 {
-				
-			} else if h1Text != "" && len(h1Text) > 3 {
-				
-				h1Text = regexp.MustCompile(`^-\d+`).ReplaceAllString(h1Text, "")
-				devotionalTitle = strings.TrimSpace(h1Text)
-			}
+			h1Text = strings.ReplaceAll(h1Text, scriptureRef, "")
+			devotionalTitle = strings.TrimSpace(h1Text)
 		}
 		
 		
-		if devotionalTitle == "" {
-			devotionalTitle = s.extractDevotionalTitle(cleanText, scriptureRef)
+		if devotionalTitle != "" {
+			
+			devotionalTitle = issueNumberRegex.ReplaceAllString(devotionalTitle, "")
+			devotionalTitle = strings.TrimSpace(devotionalTitle)
 		}
-		content.DevotionalTitle = devotionalTitle
-		
-		
-		content.ScriptureReference = scriptureRef
-
 		
-		content.DevotionalContent = s.extractParagraphs(mainContent)
-
-		
-		if len(content.DevotionalContent) == 0 {
-			content.DevotionalContent = s.extractParagraphsFromText(cleanText)
+		if devotionalTitle != "" && len(devotionalTitle) > 3 {
+			
+		} else if h1Text != "" && len(h1Text) > 3 {
+			
+			h1Text = issueNumberRegex.ReplaceAllString(h1Text, "")
+			devotionalTitle = strings.TrimSpace(h1Text)
 		}
-
-		
-		content.FullText = s.buildFullText(content.DevotionalContent)
-		content.WordCount = len(strings.Fields(content.FullText))
-		content.ParagraphCount = len(content.DevotionalContent)
-
-		log.Printf("Extracted %d paragraphs from %s", content.ParagraphCount, url)
-	})
-
+	}
 	
-	err := s.collector.Visit(url)
-	if err != nil || len(content.DevotionalContent) == 0 {
-		log.Printf("Direct URL failed or no content, trying print URL: %s", printURL)
-		if err := s.collector.Visit(printURL); err != nil {
-			return nil, fmt.Errorf("failed to scrape both URLs %s and %s: %w", url, printURL, err)
-		}
+	
+	if devotionalTitle == "" {
+		devotionalTitle = s.extractDevotionalTitle(cleanText, scriptureRef)
 	}
+	content.DevotionalTitle = devotionalTitle
+	
+	
+	content.ScriptureReference = scriptureRef
 
-	if scrapingError != nil {
-		return nil, scrapingError
-	}
+	
+	content.DevotionalContent = s.extractParagraphs(mainContent, allText)
 
 	
-	if content.ScriptureReference == "" && len(content.DevotionalContent) == 0 {
-		log.Printf("Warning: Low quality content extracted from %s", url)
+	if len(content.DevotionalContent) == 0 {
+		content.DevotionalContent = s.extractParagraphsFromText(cleanText)
 	}
 
-	return &content, nil
+	
+	content.FullText = s.buildFullText(content.DevotionalContent)
+	content.WordCount = countWords(content.FullText)
+	content.ParagraphCount = len(content.DevotionalContent)
+
+	log.Printf("Extracted %d paragraphs from %s", content.ParagraphCount, url)
 }
 
 func (s *SABDAScraper) extractDevotionalTitle(text, scriptureRef string) string {
@@ -278,13 +497,11 @@ func (s *SABDAScraper) extractDevotionalTitle(text, scriptureRef string) string
 	if scriptureRef != "" {
 		
 		
-		scripturePattern := regexp.MustCompile(regexp.QuoteMeta(scriptureRef) + `([A-Za-z][^,.\n]*?)(?:\s|$)`)
-		match := scripturePattern.FindStringSubmatch(text)
-		if len(match) > 1 {
-			title := strings.TrimSpace(match[1])
+		if title := titleAfterRef(text, scriptureRef); title != "" {
+			title = strings.TrimSpace(title)
 			
-			title = regexp.MustCompile(`^-?\d*`).ReplaceAllString(title, "")  
-			title = regexp.MustCompile(`\s{2,}`).ReplaceAllString(title, " ") 
+			title = leadingNumberRegex.ReplaceAllString(title, "")  
+			title = multiSpaceRegex.ReplaceAllString(title, " ") 
 			title = strings.TrimSpace(title)
 			
 			if len(title) > 2 && len(title) < 100 {
@@ -300,18 +517,18 @@ func (s *SABDAScraper) extractDevotionalTitle(text, scriptureRef string) string
 		line = strings.TrimSpace(line)
 		
 		
-		if len(line) < 3 || len(line) > 50 ||
-		   strings.HasPrefix(strings.ToLower(line), "ketika") ||
-		   strings.Contains(strings.ToLower(line), "diperhadapkan") ||
-		   strings.Contains(strings.ToLower(line), "sabda") ||
-		   strings.Contains(strings.ToLower(line), "publikasi") ||
-		   strings.Contains(strings.ToLower(line), "http") ||
+		if len(line) < 3 || len(line) > 50 {
+			continue
+		}
+		lineLower := strings.ToLower(line)
+		if strings.HasPrefix(lineLower, "ketika") ||
+		   containsAny(lineLower, titleSkipPatterns) ||
 		   strings.Contains(line, scriptureRef) {
 			continue
 		}
 		
 		
-		if regexp.MustCompile(`^[A-Z][a-zA-Z\s!?]*$`).MatchString(line) {
+		if titleLineRegex.MatchString(line) {
 			return line
 		}
 	}
@@ -319,81 +536,133 @@ func (s *SABDAScraper) extractDevotionalTitle(text, scriptureRef string) string
 	return ""
 }
 
-func (s *SABDAScraper) extractParagraphs(selection *goquery.Selection) []string {
+// titleAfterRef returns the title-like text directly following an
+// occurrence of scriptureRef in text.
+func titleAfterRef(text, scriptureRef string) string {
+	for offset := 0; ; {
+		i := strings.Index(text[offset:], scriptureRef)
+		if i < 0 {
+			return ""
+		}
+		offset += i + len(scriptureRef)
+		if match := titleAfterRefRegex.FindStringSubmatch(text[offset:]); len(match) > 1 {
+			return match[1]
+		}
+	}
+}
+
+// splitSentences splits text after sentence-ending punctuation followed by
+// whitespace and an uppercase letter. RE2 has no lookahead, so the next
+// character is checked by hand.
+func splitSentences(text string) []string {
+	var sentences []string
+	start := 0
+	for _, loc := range sentenceBreakRegex.FindAllStringIndex(text, -1) {
+		if loc[1] < len(text) && text[loc[1]] >= 'A' && text[loc[1]] <= 'Z' {
+			sentences = append(sentences, text[start:loc[0]+1])
+			start = loc[1]
+		}
+	}
+	return append(sentences, text[start:])
+}
+
+// extractParagraphs collects paragraphs from selection. allText is the
+// selection's already-extracted text, reused by the text fallback so the
+// subtree is not walked a second time.
+func (s *SABDAScraper) extractParagraphs(selection *goquery.Selection, allText string) []string {
 	var paragraphs []string
+	// found counts paragraphs that passed the filters before cleanup, which
+	// is what decides whether the text fallback is needed.
+	found := 0
 
 	
-	selection.Find("p, P").Each(func(i int, p *goquery.Selection) {
+	selection.FindMatcher(paragraphSelector).EachWithBreak(func(i int, p *goquery.Selection) bool {
 		text := strings.TrimSpace(p.Text())
 		
 		
 		if text == "" || text == "\u00a0" {
-			return
+			return true
+		}
+
+		// Nothing after the copyright footer is devotional content.
+		if strings.Contains(text, footerMarker) {
+			return false
 		}
 
 		
 		if align, exists := p.Attr("align"); exists && align == "center" {
-			return
+			return true
 		}
 
 		
-		if s.isDonationContent(text) {
-			return
+		if len(text) < 50 {
+			return true
 		}
 
 		
-		if len(text) < 50 {
-			return
+		if s.isDonationContent(text) {
+			return true
 		}
 
 		
-		text = regexp.MustCompile(`\s{2,}`).ReplaceAllString(text, " ")
-		paragraphs = append(paragraphs, text)
+		text = multiSpaceRegex.ReplaceAllString(text, " ")
+		found++
+		if text = cleanParagraph(text); len(text) > 50 {
+			paragraphs = append(paragraphs, text)
+		}
+		return true
 	})
 
 	
-	if len(paragraphs) <= 1 {
+	if found <= 1 {
 		log.Println("Using text-based paragraph extraction")
-		paragraphs = s.extractParagraphsFromText(selection.Text())
+		paragraphs = paragraphs[:0]
+		for _, para := range s.extractParagraphsFromText(allText) {
+			if para = cleanParagraph(para); len(para) > 50 {
+				paragraphs = append(paragraphs, para)
+			}
+		}
 	}
 
-	
-	var cleanedParagraphs []string
-	for _, para := range paragraphs {
-		
-		para = regexp.MustCompile(`\s*\[[\w\s]+\]\s*$`).ReplaceAllString(para, "")
-		para = strings.TrimSpace(para)
+	return paragraphs
+}
 
-		if len(para) > 50 {
-			cleanedParagraphs = append(cleanedParagraphs, para)
-		}
+// cleanParagraph strips a trailing author tag such as "[PMS]". The tag
+// regex is anchored at the end but RE2 still scans the whole string, so it
+// only runs when the paragraph actually ends in "]".
+func cleanParagraph(para string) string {
+	para = strings.TrimSpace(para)
+	if strings.HasSuffix(para, "]") {
+		para = strings.TrimSpace(authorTagRegex.ReplaceAllString(para, ""))
 	}
-
-	return cleanedParagraphs
+	return para
 }
 
 func (s *SABDAScraper) extractParagraphsFromText(text string) []string {
 	var paragraphs []string
 	
-	lines := strings.Split(text, "\n")
-	var textLines []string
+	// Lines are walked in place and kept lines are written straight into
+	// one builder, rather than splitting into a slice and joining after.
+	var content strings.Builder
+	content.Grow(len(text))
 	foundContentStart := false
 
-	for _, line := range lines {
+	for rest := text; rest != ""; {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
 		line = strings.TrimSpace(line)
 		lineLower := strings.ToLower(line)
 
 		
 		if !foundContentStart {
-			if strings.Contains(lineLower, "lukas") || strings.Contains(lineLower, "matius") || 
-			   strings.Contains(lineLower, "markus") || strings.Contains(lineLower, "yohanes") {
+			if containsAny(lineLower, gospelNames) {
 				foundContentStart = true
 			}
 			continue
 		}
 
 		
-		if s.isDonationContent(line) {
+		if containsAny(lineLower, donationPatterns) {
 			break
 		}
 
@@ -404,17 +673,23 @@ func (s *SABDAScraper) extractParagraphsFromText(text string) []string {
 
 		
 		if len(line) > 15 {
-			textLines = append(textLines, line)
+			if content.Len() > 0 {
+				content.WriteByte(' ')
+			}
+			content.WriteString(line)
 		}
 	}
 
 	
-	contentText := strings.Join(textLines, " ")
+	contentText := content.String()
 
 	if len(contentText) > 300 {
 		
-		sentences := regexp.MustCompile(`(?:[.!?])\s+(?=[A-Z])`).Split(contentText, -1)
+		sentences := splitSentences(contentText)
 		var currentPara []string
+		// paraLen is the joined length of currentPara, tracked so the
+		// paragraph is only joined once it is flushed.
+		paraLen := 0
 
 		for _, sentence := range sentences {
 			sentence = strings.TrimSpace(sentence)
@@ -422,15 +697,17 @@ func (s *SABDAScraper) extractParagraphsFromText(text string) []string {
 				continue
 			}
 
+			if len(currentPara) > 0 {
+				paraLen++
+			}
 			currentPara = append(currentPara, sentence)
+			paraLen += len(sentence)
 
 			
-			if len(strings.Join(currentPara, " ")) > 200 {
-				paraText := strings.Join(currentPara, " ")
-				if len(paraText) > 100 {
-					paragraphs = append(paragraphs, paraText)
-					currentPara = []string{}
-				}
+			if paraLen > 200 {
+				paragraphs = append(paragraphs, strings.Join(currentPara, " "))
+				currentPara = currentPara[:0]
+				paraLen = 0
 			}
 		}
 
@@ -445,17 +722,17 @@ func (s *SABDAScraper) extractParagraphsFromText(text string) []string {
 
 	
 	if len(paragraphs) <= 1 && len(contentText) > 0 {
-		words := strings.Fields(contentText)
-		if len(words) > 150 {
-			third := len(words) / 3
-			para1 := strings.Join(words[:third], " ")
-			para2 := strings.Join(words[third:2*third], " ")
-			para3 := strings.Join(words[2*third:], " ")
+		if words := countWords(contentText); words > 150 {
+			// Cut at word boundaries by byte offset instead of splitting
+			// into a word slice and joining each third back together.
+			third := words / 3
+			cut1 := wordStart(contentText, third)
+			cut2 := cut1 + wordStart(contentText[cut1:], third)
 			
 			paragraphs = []string{
-				strings.TrimSpace(para1),
-				strings.TrimSpace(para2),
-				strings.TrimSpace(para3),
+				strings.TrimSpace(contentText[:cut1]),
+				strings.TrimSpace(contentText[cut1:cut2]),
+				strings.TrimSpace(contentText[cut2:]),
 			}
 		} else if contentText != "" {
 			paragraphs = []string{strings.TrimSpace(contentText)}
@@ -479,42 +756,96 @@ func (s *SABDAScraper) buildFullText(paragraphs []string) string {
 	return strings.Join(paragraphs, " ")
 }
 
-func (s *SABDAScraper) isDonationContent(text string) bool {
-	textLower := strings.ToLower(text)
-	donationPatterns := []string{
-		"mari memberkati",
-		"pancar pijar alkitab",
-		"bca 106.30066.22",
-		"yayasan lembaga sabda",
-		"webmaster@",
-		"ylsa.org",
-		"copyright",
-		"© ",
-		"santapan harian",
-	}
-
-	for _, pattern := range donationPatterns {
-		if strings.Contains(textLower, pattern) {
-			return true
+// countWords counts whitespace-separated words without allocating them.
+func countWords(text string) int {
+	count := 0
+	inWord := false
+	for _, r := range text {
+		if unicode.IsSpace(r) {
+			inWord = false
+		} else if !inWord {
+			inWord = true
+			count++
 		}
 	}
-	return false
+	return count
 }
 
-func (s *SABDAScraper) isHeaderContent(text string) bool {
-	headerPatterns := []string{
-		"sabda.org",
-		"publikasi",
-		"versi cetak",
-		"http://",
-		"https://",
-		"halaman ini adalah versi",
+// wordStart returns the byte offset of the k-th (zero-based) word in text,
+// using the same whitespace rules as countWords, or len(text) if there are
+// not that many words.
+func wordStart(text string, k int) int {
+	inWord := false
+	for i, r := range text {
+		if unicode.IsSpace(r) {
+			inWord = false
+		} else if !inWord {
+			if k == 0 {
+				return i
+			}
+			inWord = true
+			k--
+		}
 	}
+	return len(text)
+}
+
+// gospelNames mark the scripture line where devotional text begins.
+var gospelNames = []string{
+	"lukas",
+	"matius",
+	"markus",
+	"yohanes",
+}
 
-	for _, pattern := range headerPatterns {
+// titleSkipPatterns mark lowercase lines that are never the title.
+var titleSkipPatterns = []string{
+	"diperhadapkan",
+	"sabda",
+	"publikasi",
+	"http",
+}
+
+// footerMarker opens the YLSA copyright footer that closes each page.
+const footerMarker = "Yayasan Lembaga SABDA"
+
+// donationPatterns mark the lowercase donation/copyright footer.
+var donationPatterns = []string{
+	"mari memberkati",
+	"pancar pijar alkitab",
+	"bca 106.30066.22",
+	"yayasan lembaga sabda",
+	"webmaster@",
+	"ylsa.org",
+	"copyright",
+	"© ",
+	"santapan harian",
+}
+
+// headerPatterns mark lowercase navigation and print-header lines.
+var headerPatterns = []string{
+	"sabda.org",
+	"publikasi",
+	"versi cetak",
+	"http://",
+	"https://",
+	"halaman ini adalah versi",
+}
+
+func (s *SABDAScraper) isDonationContent(text string) bool {
+	return containsAny(strings.ToLower(text), donationPatterns)
+}
+
+func (s *SABDAScraper) isHeaderContent(text string) bool {
+	return containsAny(text, headerPatterns)
+}
+
+// containsAny reports whether text contains any of patterns.
+func containsAny(text string, patterns []string) bool {
+	for _, pattern := range patterns {
 		if strings.Contains(text, pattern) {
 			return true
 		}
 	}
 	return false
-}
\ No newline at end of file
+}